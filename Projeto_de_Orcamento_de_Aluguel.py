@@ -3,7 +3,7 @@ Projeto: Orçamento de Aluguel - Parte Prática
 Arquivo: main.py (único arquivo contendo a aplicação em linha de comando)
 
 Instruções:
-- Execute com: python Projeto_Orçamento_Aluguel.py
+- Execute com: python Projeto_Orçamento_Aluguel.py (requer Python 3.10+)
 - A aplicação solicita dados do usuário, calcula o valor do aluguel mensal, o parcelamento do contrato
   (R$ 2.000,00 em até 5x) e gera um arquivo .csv com 12 parcelas do orçamento (mensalidades do ano),
   indicando também em quais meses há pagamento das parcelas do contrato.
@@ -25,13 +25,101 @@ Regras implementadas (conforme enunciado):
 - Desconto: Apartamento sem crianças -> 5% no valor do aluguel
 
 """
+from array import array
 from dataclasses import dataclass, asdict
-from datetime import datetime
-import csv
+from typing import ClassVar
 import os
+import time
 
 
-@dataclass
+# Códigos inteiros dos tipos de imóvel, usados pelo cálculo da mensalidade
+APARTAMENTO, CASA, ESTUDIO = 0, 1, 2
+_TYPE_CODES = {'apartamento': APARTAMENTO, 'casa': CASA, 'estudio': ESTUDIO}
+# Valores monetários são mantidos em centavos (inteiros) e só viram float/texto na saída
+_BASE_RENTS_CENTS = (70000, 90000, 120000)  # indexado pelo código do tipo
+
+# Buffer de escrita do CSV: o arquivo inteiro cabe nele, então vai ao disco numa só escrita
+_CSV_BUFFER_SIZE = 65536
+
+# Pasta de saída dos CSVs; criada por to_csv quando ainda não existir
+_OUT_DIR = 'output'
+
+# Último timestamp (resolução de segundos) usado no nome padrão do arquivo e
+# quantos arquivos já foram gerados nesse mesmo segundo
+_last_ts_second = None
+_last_ts_str = ''
+_last_ts_count = 0
+
+
+def _default_filename() -> str:
+    """Nome padrão 'orcamento_AAAAMMDD_HHMMSS.csv'. Formata o horário só quando o
+    segundo muda; orçamentos gerados no mesmo segundo recebem um sufixo _1, _2, ...
+    em vez de sobrescrever o arquivo anterior.
+    """
+    global _last_ts_second, _last_ts_str, _last_ts_count
+    now = int(time.time())
+    if now != _last_ts_second:
+        _last_ts_second = now
+        _last_ts_str = time.strftime('%Y%m%d_%H%M%S', time.localtime(now))
+        _last_ts_count = 0
+        return f'orcamento_{_last_ts_str}.csv'
+    _last_ts_count += 1
+    return f'orcamento_{_last_ts_str}_{_last_ts_count}.csv'
+
+
+def _type_code(property_type: str) -> int:
+    try:
+        return _TYPE_CODES[property_type.lower()]
+    except KeyError:
+        raise ValueError(f"Tipo de imóvel desconhecido: {property_type}") from None
+
+
+def _format_cents(cents: int) -> str:
+    # Equivalente a f'{cents / 100:.2f}' para valores não negativos, sem passar por float
+    return f'{cents // 100}.{cents % 100:02d}'
+
+
+def _rent_cents(ptype: int, bedrooms: int, garage: bool, studio_pack: bool,
+                studio_extra: int, has_children: bool) -> int:
+    """Regras da mensalidade sobre valores primitivos (tipo já convertido em código).
+    Retorna o valor em centavos.
+    """
+    rent = _BASE_RENTS_CENTS[ptype]
+
+    # Ajuste por quartos
+    if ptype == APARTAMENTO and bedrooms == 2:
+        rent += 20000
+    if ptype == CASA and bedrooms == 2:
+        rent += 25000
+
+    # Vaga de garagem para casas e apartamentos
+    if ptype != ESTUDIO and garage:
+        rent += 30000
+
+    # Estudio - pacote de 2 vagas + vagas extras
+    if ptype == ESTUDIO and studio_pack:
+        # pacote de 2 vagas por 250
+        rent += 25000
+        # vagas extras (cada uma 60)
+        if studio_extra > 0:
+            rent += 6000 * studio_extra
+
+    # Desconto: 5% para apartamento sem crianças (95% = 19/20, arredondado ao centavo)
+    if ptype == APARTAMENTO and not has_children:
+        rent = (rent * 19 + 10) // 20
+
+    return rent
+
+
+def _rent_kernel(ptype: int, bedrooms: int, garage: bool, studio_pack: bool,
+                 studio_extra: int, has_children: bool) -> float:
+    """Mensalidade em reais (float com 2 casas), a partir de _rent_cents.
+    Compartilhado por RentalQuote.compute_monthly_rent e compute_monthly_rent_batch.
+    """
+    return _rent_cents(ptype, bedrooms, garage, studio_pack, studio_extra, has_children) / 100
+
+
+@dataclass(slots=True)
 class RentalQuote:
     property_type: str  # 'apartamento', 'casa', 'estudio'
     bedrooms: int = 1
@@ -41,57 +129,31 @@ class RentalQuote:
     has_children: bool = True  # usado para desconto em apartamentos
     contract_installments: int = 1  # 1..5
 
-    CONTRACT_VALUE: float = 2000.0
+    CONTRACT_CENTS: ClassVar[int] = 200000  # R$ 2.000,00; atributo de classe, fora dos slots
+    CONTRACT_VALUE: ClassVar[float] = CONTRACT_CENTS / 100  # derivado, não altere diretamente
 
     def base_rent(self) -> float:
-        t = self.property_type.lower()
-        if t == 'apartamento':
-            return 700.0
-        elif t == 'casa':
-            return 900.0
-        elif t == 'estudio':
-            return 1200.0
-        else:
-            raise ValueError(f"Tipo de imóvel desconhecido: {self.property_type}")
+        return _BASE_RENTS_CENTS[_type_code(self.property_type)] / 100
+
+    def monthly_rent_cents(self) -> int:
+        return _rent_cents(_type_code(self.property_type), self.bedrooms, self.garage,
+                           self.studio_base_parking, self.studio_extra_vagas, self.has_children)
 
     def compute_monthly_rent(self) -> float:
-        rent = self.base_rent()
-        t = self.property_type.lower()
-
-        # Ajuste por quartos
-        if t == 'apartamento' and self.bedrooms == 2:
-            rent += 200.0
-        if t == 'casa' and self.bedrooms == 2:
-            rent += 250.0
-
-        # Vaga de garagem para casas e apartamentos
-        if t in ('apartamento', 'casa') and self.garage:
-            rent += 300.0
-
-        # Estudio - pacote de 2 vagas + vagas extras
-        if t == 'estudio' and self.studio_base_parking:
-            # pacote de 2 vagas por 250
-            rent += 250.0
-            # vagas extras (cada uma 60)
-            if self.studio_extra_vagas > 0:
-                rent += 60.0 * self.studio_extra_vagas
-
-        # Desconto: 5% para apartamento sem crianças
-        if t == 'apartamento' and not self.has_children:
-            rent = rent * 0.95
-
-        # arredondar para 2 casas decimais
-        return round(rent, 2)
+        return self.monthly_rent_cents() / 100
 
-    def contract_installment_value(self) -> float:
-        # Divide os R$ 2000,00 em até 5x
+    def contract_installment_cents(self) -> int:
+        # Divide os R$ 2000,00 em até 5x, arredondando a parcela ao centavo mais próximo
         n = max(1, min(self.contract_installments, 5))
-        return round(self.CONTRACT_VALUE / n, 2)
+        return (2 * self.CONTRACT_CENTS + n) // (2 * n)
+
+    def contract_installment_value(self) -> float:
+        return self.contract_installment_cents() / 100
 
     def total_monthly_with_contract(self) -> float:
         # Caso queira somar a parcela do contrato ao valor mensal (apenas nos meses com parcela)
         # Aqui não soma automaticamente; é uma utilidade: mensalidade + contrato_parcela
-        return round(self.compute_monthly_rent() + self.contract_installment_value(), 2)
+        return (self.monthly_rent_cents() + self.contract_installment_cents()) / 100
 
     def to_csv(self, filename: str = None) -> str:
         """Gera um CSV com 12 parcelas do orçamento (lista dos 12 meses).
@@ -99,30 +161,107 @@ class RentalQuote:
         Colunas: mes, mensalidade, contrato_parcela, total_no_mes
         Retorna o caminho do arquivo gerado.
         """
-        mensalidade = self.compute_monthly_rent()
-        contrato_parcela = self.contract_installment_value()
+        mensalidade = self.monthly_rent_cents()
+        contrato_parcela = self.contract_installment_cents()
         installments = max(1, min(self.contract_installments, 5))
 
         if filename is None:
-            ts = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f'orcamento_{ts}.csv'
-
-        # Garante pasta 'output' existindo
-        out_dir = 'output'
-        os.makedirs(out_dir, exist_ok=True)
-        filepath = os.path.join(out_dir, filename)
-
-        with open(filepath, mode='w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(['mes', 'mensalidade', 'contrato_parcela', 'total_no_mes'])
-            for m in range(1, 13):
-                contrato_here = contrato_parcela if m <= installments else 0.0
-                total = round(mensalidade + contrato_here, 2)
-                writer.writerow([m, f'{mensalidade:.2f}', f'{contrato_here:.2f}', f'{total:.2f}'])
+            filename = _default_filename()
+
+        filepath = os.path.join(_OUT_DIR, filename)
+
+        # Só existem dois tipos de linha (com e sem parcela do contrato), então
+        # montamos cada uma uma única vez e escrevemos o arquivo inteiro de uma vez.
+        # Os campos são apenas números, sem necessidade de aspas; mantemos o
+        # terminador '\r\n' que o módulo csv usava por padrão.
+        mensal_s = _format_cents(mensalidade)
+        contr_s = _format_cents(contrato_parcela)
+        total_with_s = _format_cents(mensalidade + contrato_parcela)
+        with_contract = f',{mensal_s},{contr_s},{total_with_s}\r\n'
+        without_contract = f',{mensal_s},0.00,{mensal_s}\r\n'
+
+        lines = ['mes,mensalidade,contrato_parcela,total_no_mes\r\n']
+        for m in range(1, 13):
+            lines.append(f'{m}{with_contract if m <= installments else without_contract}')
+
+        # Abre direto; só cria a pasta 'output' se ela ainda não existir
+        try:
+            f = open(filepath, mode='w', newline='', encoding='utf-8', buffering=_CSV_BUFFER_SIZE)
+        except FileNotFoundError:
+            os.makedirs(_OUT_DIR, exist_ok=True)
+            f = open(filepath, mode='w', newline='', encoding='utf-8', buffering=_CSV_BUFFER_SIZE)
+        with f:
+            f.write(''.join(lines))
 
         return filepath
 
 
+def rent_batch_kernel(ptypes, bedrooms, garage, studio_pack, studio_extra, has_children, out):
+    """Aplica _rent_kernel a sequências paralelas já codificadas (tipo como inteiro)
+    e grava cada mensalidade na posição correspondente de `out` (lista ou array('d')
+    com o mesmo tamanho de `ptypes`). Retorna `out`.
+    Todas as colunas precisam ter o mesmo tamanho; caso contrário gera ValueError.
+    """
+    n = len(ptypes)
+    for col in (bedrooms, garage, studio_pack, studio_extra, has_children, out):
+        if len(col) != n:
+            raise ValueError(f'Colunas com tamanhos diferentes: esperado {n}, recebido {len(col)}')
+    for i, rent in enumerate(map(_rent_kernel, ptypes, bedrooms, garage,
+                                 studio_pack, studio_extra, has_children)):
+        out[i] = rent
+    return out
+
+
+def compute_monthly_rent_batch(types, bedrooms, garage, has_children,
+                               studio_base_parking, studio_extra_vagas) -> list:
+    """Calcula a mensalidade de vários cenários de uma vez.
+    Recebe sequências paralelas (uma posição por cenário) com os mesmos campos de
+    RentalQuote e retorna a lista de mensalidades, na mesma ordem.
+    """
+    ptypes = [_type_code(t) for t in types]
+    out = [0.0] * len(ptypes)
+    return rent_batch_kernel(ptypes, bedrooms, garage, studio_base_parking,
+                             studio_extra_vagas, has_children, out)
+
+
+@dataclass
+class RentalQuoteBatch:
+    """Vários orçamentos em colunas (um array contíguo por campo) em vez de uma
+    lista de RentalQuote; pensado para relatórios com muitos cenários.
+    O tipo de imóvel é guardado pelo código inteiro (APARTAMENTO, CASA, ESTUDIO).
+    """
+    property_type_code: array  # 'b'
+    bedrooms: array  # 'i'
+    garage: array  # 'b'
+    studio_base_parking: array  # 'b'
+    studio_extra_vagas: array  # 'i'
+    has_children: array  # 'b'
+    contract_installments: array  # 'i'
+
+    @classmethod
+    def from_quotes(cls, quotes) -> 'RentalQuoteBatch':
+        quotes = list(quotes)
+        return cls(
+            property_type_code=array('b', (_type_code(q.property_type) for q in quotes)),
+            bedrooms=array('i', (q.bedrooms for q in quotes)),
+            garage=array('b', (bool(q.garage) for q in quotes)),
+            studio_base_parking=array('b', (bool(q.studio_base_parking) for q in quotes)),
+            studio_extra_vagas=array('i', (q.studio_extra_vagas for q in quotes)),
+            has_children=array('b', (bool(q.has_children) for q in quotes)),
+            contract_installments=array('i', (q.contract_installments for q in quotes)),
+        )
+
+    def __len__(self) -> int:
+        return len(self.property_type_code)
+
+    def compute_monthly_rents(self) -> array:
+        """Mensalidade de cada orçamento, na mesma ordem, como array('d')."""
+        out = array('d', [0.0]) * len(self)
+        return rent_batch_kernel(self.property_type_code, self.bedrooms, self.garage,
+                                 self.studio_base_parking, self.studio_extra_vagas,
+                                 self.has_children, out)
+
+
 def pergunta_sim_nao(prompt: str) -> bool:
     while True:
         r = input(prompt + ' (s/n): ').strip().lower()
@@ -199,7 +338,7 @@ def main():
     print(f'Quartos: {quote.bedrooms}')
     print(f'Vaga de garagem (aplicável): {"Sim" if quote.garage or (quote.property_type=="estudio" and quote.studio_base_parking) else "Não"}')
     print(f'Valor do aluguel mensal (mensalidade): R$ {mensal:.2f}')
-    print(f'Valor do contrato total: R$ {quote.CONTRACT_VALUE:.2f} | Parcelas escolhidas: {quote.contract_installments} x R$ {parcela_contrato:.2f} (aplicadas nos primeiros {quote.contract_installments} meses)')
+    print(f'Valor do contrato total: R$ {_format_cents(quote.CONTRACT_CENTS)} | Parcelas escolhidas: {quote.contract_installments} x R$ {parcela_contrato:.2f} (aplicadas nos primeiros {quote.contract_installments} meses)')
 
     filepath = quote.to_csv()
     print(f'Arquivo CSV com 12 parcelas gerado em: {filepath}')